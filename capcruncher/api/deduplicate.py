@@ -7,15 +7,20 @@ from collections import namedtuple
 from multiprocessing import Process
 from typing import Iterable, Tuple
 
+import numpy as np
 import pandas as pd
 import ujson
 import xxhash
-from capcruncher.utils import get_file_type, save_dict
+from capcruncher.utils import get_file_type, load_dict, save_dict
 
 
 class ReadDeduplicationParserProcess(Process):
     """
-    Process subclass for parsing fastq file(s) into a hashed {id:sequence} json format.
+    Process subclass for parsing fastq file(s) into hashed (id, sequence) pairs.
+
+    Pairs are saved as a packed uint64 numpy array (.npy) by default; the
+    legacy {id: sequence} json/pickle formats are still supported via the
+    output path extension.
 
     Attributes:
      inq: Input read queue
@@ -28,7 +33,7 @@ class ReadDeduplicationParserProcess(Process):
         self,
         inq: multiprocessing.Queue,
         hash_seed: int = 42,
-        output_path: os.PathLike = "parsed.json",
+        output_path: os.PathLike = "parsed.npy",
     ):
         """
         Args:
@@ -79,7 +84,128 @@ class ReadDeduplicationParserProcess(Process):
                 continue
 
         output_format = get_file_type(self.output_path)
-        save_dict(records, self.output_path, output_format)
+
+        if output_format == "numpy":
+            # Packed (read_hash, seq_hash) uint64 pairs are ~10x smaller on
+            # disk than the hex-string json dict and avoid the json
+            # encode/decode round-trip entirely.
+            pairs = np.empty((len(records), 2), dtype=np.uint64)
+            pairs[:, 0] = np.fromiter(records.keys(), dtype=np.uint64, count=len(records))
+            pairs[:, 1] = np.fromiter(
+                records.values(), dtype=np.uint64, count=len(records)
+            )
+            np.save(self.output_path, pairs)
+        else:
+            save_dict(records, self.output_path, output_format)
+
+
+def _load_parsed_read_pairs(path: os.PathLike):
+    """Yields (read_hash, seq_hash) pairs from a parsed read chunk.
+
+    Packed uint64 .npy chunks (the ReadDeduplicationParserProcess default) are
+    memcpy-loaded and avoid the python-bound json decode of the legacy
+    formats.
+    """
+
+    if get_file_type(path) == "numpy":
+        pairs = np.load(path)
+        return zip(pairs[:, 0].tolist(), pairs[:, 1].tolist())
+
+    parsed = load_dict(path, format=get_file_type(path), dtype="int")
+    return parsed.items()
+
+
+def find_duplicates(input_files: Iterable):
+    """Yields duplicated read ids from parsed {read_hash: seq_hash} chunks.
+
+    Chunks produced by ReadDeduplicationParserProcess are streamed in a single
+    pass: the first read seen for a given sequence hash is kept and any later
+    read sharing that sequence hash is yielded as a duplicate. A read is
+    duplicated iff its sequence appeared earlier in the merged iteration, so
+    this matches the keep-one-representative-per-sequence semantics while only
+    ever holding the unique sequence set in memory; each chunk's pairs go out
+    of scope as soon as it has been consumed.
+
+    Args:
+     input_files (Iterable): Paths to parsed read chunks (npy/json/pickle format).
+
+    Yields:
+     int: Hashed ids of duplicated reads, in the order they were encountered.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    input_files = list(input_files)
+    sequences_seen = set()
+    n_reads_parsed = 0
+
+    # Disk reads, gzip inflate and the numpy/ujson decodes all release the
+    # GIL, so a thread pool overlaps loading chunk N+1 with merging chunk N.
+    # Merging stays on the main thread (ex.map yields in order) so the seen
+    # set needs no locking.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(input_files)))) as ex:
+        for pairs in ex.map(_load_parsed_read_pairs, input_files):
+            for read_hash, sequence_hash in pairs:
+                n_reads_parsed += 1
+
+                if sequence_hash in sequences_seen:
+                    yield read_hash
+                else:
+                    sequences_seen.add(sequence_hash)
+
+    logger.info(f"Parsed {n_reads_parsed} reads")
+
+
+def identify_duplicates(
+    input_files: Iterable,
+    output: os.PathLike = None,
+    buffer_size: int = 1_000_000,
+) -> int:
+    """Identifies duplicated reads and saves their ids to the output path.
+
+    Duplicates found by find_duplicates are spilled to binary (.bin) output
+    incrementally in buffer_size batches, so peak memory is bounded by the
+    unique sequence set plus one buffer rather than also holding every
+    duplicate id. Json/pickle output still requires the full id set in
+    memory as save_dict serialises a single object.
+
+    Args:
+     input_files (Iterable): Paths to parsed read chunks (npy/json/pickle format).
+     output (os.PathLike, optional): If provided, duplicated ids are saved here
+                                     in a format useable by read_duplicated_ids.
+     buffer_size (int, optional): Number of ids spilled per write for binary output.
+
+    Returns:
+     int: Number of duplicated reads identified.
+    """
+
+    duplicates = find_duplicates(input_files)
+    n_duplicates = 0
+
+    if output and get_file_type(output) == "binary":
+        buffer = []
+        with open(output, "wb") as w:
+            for read_hash in duplicates:
+                buffer.append(read_hash)
+                if len(buffer) == buffer_size:
+                    np.asarray(buffer, dtype=np.uint64).tofile(w)
+                    n_duplicates += len(buffer)
+                    buffer.clear()
+
+            if buffer:
+                np.asarray(buffer, dtype=np.uint64).tofile(w)
+                n_duplicates += len(buffer)
+
+    else:
+        ids_duplicated = set(duplicates)
+        n_duplicates = len(ids_duplicated)
+
+        if output:
+            save_dict(ids_duplicated, output, format=get_file_type(output))
+
+    logger.info(f"Identified {n_duplicates} duplicated reads")
+
+    return n_duplicates
 
 
 RemovalStatistics = namedtuple(
@@ -94,7 +220,7 @@ class ReadDuplicateRemovalProcess(Process):
     Attributes:
      inq: Input read queue
      outq: Output queue for deduplicated reads.
-     duplicated_ids: Concatenated read ids to remove from input fastq files.
+     duplicated_ids: Sorted array of hashed read ids to remove from input fastq files.
      statq: Output queue for statistics.
      reads_total: Number of fastq reads processed.
      reads_unique: Number of non-duplicated reads output.
@@ -106,7 +232,7 @@ class ReadDuplicateRemovalProcess(Process):
         inq: multiprocessing.Queue,
         outq: multiprocessing.Queue,
         stats_tx: multiprocessing.Pipe,
-        duplicated_ids: set,
+        duplicated_ids: np.ndarray,
         hash_seed: int = 42,
         hash_read_name: bool = True,
     ):
@@ -114,7 +240,10 @@ class ReadDuplicateRemovalProcess(Process):
         Args:
          inq (multiprocessing.SimpleQueue): Input queue for reads to be deduplicated.
          outq (multiprocessing.SimpleQueue): Output queue for deduplicated reads.
-         duplicated_ids (set): Hashed read ids to be removed if encountered.
+         duplicated_ids (np.ndarray): Sorted uint64 array of hashed read ids to be removed if encountered.
+                                      A packed sorted array occupies 8 bytes per id rather than the
+                                      ~56 bytes of a python set entry and is shared read-only with
+                                      forked workers without breaking copy-on-write.
          statq (multiprocessing.Queue, optional): Output queue for statistics.
          hash_seed (int, optional): Seed for xxhash algorithm. Defaults to 42.
         """
@@ -122,7 +251,7 @@ class ReadDuplicateRemovalProcess(Process):
         self.inq = inq
         self.outq = outq
         self.hash_seed = hash_seed
-        self.duplicated_ids = duplicated_ids
+        self.duplicated_ids = np.asarray(duplicated_ids, dtype=np.uint64)
 
         # Misc
         self.hash_read_name = hash_read_name
@@ -154,11 +283,28 @@ class ReadDuplicateRemovalProcess(Process):
                 reads = self.inq.get(block=True, timeout=0.01)
 
                 if reads:
-                    for read_glob in reads:
+                    # Hash every read id in the batch then perform a single
+                    # vectorised membership test against the sorted id array
+                    # rather than dispatching a python comparison per read.
+                    hashes = np.empty(len(reads), dtype=np.uint64)
+                    for ii, read_glob in enumerate(reads):
+                        hashes[ii] = hash_function(
+                            "".join([r.name for r in read_glob])
+                        )
 
-                        hash_id = hash_function("".join([r.name for r in read_glob]))
+                    if duplicated_ids.size > 0:
+                        indices = np.searchsorted(duplicated_ids, hashes)
+                        is_duplicated = (indices < duplicated_ids.size) & (
+                            duplicated_ids[
+                                np.minimum(indices, duplicated_ids.size - 1)
+                            ]
+                            == hashes
+                        )
+                    else:
+                        is_duplicated = np.zeros(len(reads), dtype=bool)
 
-                        if hash_id not in duplicated_ids:
+                    for read_glob, duplicated in zip(reads, is_duplicated):
+                        if not duplicated:
                             if hash_read_name:
                                 for r in read_glob:
                                     r.name = str(hash_function(r.name))
@@ -225,24 +371,41 @@ def remove_duplicates_from_parquet(
     return (n_reads_total, n_reads_unique)
 
 
-def read_duplicated_ids(path: os.PathLike):
+def read_duplicated_ids(path: os.PathLike) -> np.ndarray:
+    """Loads duplicated read ids.
+
+    All supported formats (binary, json, hdf5, pickle) are returned as a
+    sorted uint64 array suitable for the binary-search membership test used
+    by ReadDuplicateRemovalProcess.
+    """
 
     from xopen import xopen
 
     file_type = get_file_type(path)
 
-    if file_type == "json":
-        with xopen.xopen(path, "r") as r:
-            ids_duplicated = {int(x) for x in ujson.load(r)}
+    if file_type == "binary":
+        ids_duplicated = np.fromfile(path, dtype=np.uint64)
+
+    elif file_type == "json":
+        with xopen(path, "r") as r:
+            ids_duplicated = np.fromiter(
+                (int(x) for x in ujson.load(r)), dtype=np.uint64
+            )
 
     elif file_type == "hdf5":
 
         try:
-            ids_duplicated = pd.read_hdf(path, key="/duplicated_ids")
+            ids_duplicated = pd.read_hdf(path, key="/duplicated_ids").to_numpy(
+                dtype=np.uint64
+            )
         except KeyError:
-            ids_duplicated = pd.Series(data=["NO_DATA"], name="/duplicated_ids")
+            ids_duplicated = np.array([], dtype=np.uint64)
 
     elif file_type == "pickle":
-        ids_duplicated = pd.read_pickle(path)
+        # save_dict pickles the ids as a set
+        ids_duplicated = np.fromiter(
+            (int(x) for x in pd.read_pickle(path)), dtype=np.uint64
+        )
 
+    ids_duplicated.sort()
     return ids_duplicated
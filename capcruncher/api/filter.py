@@ -11,6 +11,28 @@ from capcruncher.api.statistics import SliceFilterStats
 
 
 
+def lexsort_slices(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Stable sort of a slices dataframe using np.lexsort on encoded keys.
+
+    String columns are dictionary-encoded first so that the sort compares
+    int32 codes rather than variable-length strings. Equivalent to a stable
+    sort_values(columns) but substantially cheaper on the object-dtype
+    parent_read/chrom keys that dominate the slice sorts.
+    """
+
+    keys = []
+    for column in reversed(columns):  # np.lexsort treats the last key as primary
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            keys.append(values.cat.codes.to_numpy())
+        elif values.dtype == object:
+            keys.append(pd.Categorical(values).codes)
+        else:
+            keys.append(values.to_numpy())
+
+    return df.take(np.lexsort(keys))
+
+
 class SlicesDataFrameSchema(pandera.DataFrameModel):
     parent_id: Series[int]
     slice_name: Series[str]
@@ -110,7 +132,7 @@ class SliceFilter:
         slices = DataFrame[SlicesDataFrameSchema](slices)
 
         # Tweak format slices dataframe to be consistent
-        self.slices = slices.sort_values(["parent_read", "slice"]).assign(
+        self.slices = lexsort_slices(slices, ["parent_read", "slice"]).assign(
             blacklist=lambda df: df["blacklist"].astype(float),
             restriction_fragment=lambda df: df["restriction_fragment"].astype(
                 pd.Int64Dtype()
@@ -334,7 +356,9 @@ class SliceFilter:
 
     def remove_slices_without_re_frag_assigned(self):
         """Removes slices if restriction_fragment column is N/A"""
-        self.slices = self.slices.query('restriction_fragment != "."')
+        # restriction_fragment is nullable Int64 (unassigned slices are NA) so
+        # a C-level null-mask check replaces the old string comparison with "."
+        self.slices = self.slices.loc[self.slices["restriction_fragment"].notna()]
 
     def remove_duplicate_slices(self):
         """
@@ -515,9 +539,9 @@ class CCSliceFilter(SliceFilter):
          pd.DataFrame: Slices aggregated by parental read name.
 
         """
-        
+
         df = (
-            self.slices.sort_values(["parent_read", "chrom", "start"])
+            lexsort_slices(self.slices, ["parent_read", "chrom", "start"])
             .groupby("parent_read", as_index=False, sort=False)
             .agg(
                 unique_slices=("slice", "nunique"),
@@ -937,7 +961,7 @@ class TiledCSliceFilter(SliceFilter):
     @property
     def fragments(self) -> pd.DataFrame:
         df = (
-            self.slices.sort_values(["parent_read", "chrom", "start"])
+            lexsort_slices(self.slices, ["parent_read", "chrom", "start"])
             .groupby("parent_read", as_index=False, sort=False)
             .agg(
                 id=("parent_id", "first"),
@@ -1004,41 +1028,51 @@ class TiledCSliceFilter(SliceFilter):
          pd.DataFrame: Reporter cis/trans statistics
         """
 
-        interactions_by_capture = dict()
+        df_captures = self.slices.query("capture_count == 1")
 
-        for capture_site, df_cap in self.slices.query("capture_count == 1").groupby(
-            "capture"
-        ):
-            capture_chrom = df_cap.iloc[0]["chrom"]
-            df_primary_capture = df_cap.groupby(
-                "parent_read"
-            ).first()  # Artifact required as need to call one slice the "capture"
-            df_not_primary_capture = df_cap.loc[
-                ~(df_cap["slice_name"].isin(df_primary_capture["slice_name"]))
-            ]
-            df_outside_capture = self.slices.query("capture_count == 0").loc[
-                lambda df_rep: df_rep["parent_read"].isin(df_cap["parent_read"])
+        # One capture slice per fragment is designated the "primary capture";
+        # the first slice per (capture site, fragment) pair, as previously
+        # produced by a per-site groupby("parent_read").first().
+        df_not_primary_capture = df_captures.loc[
+            df_captures.duplicated(subset=["capture", "parent_read"])
+        ]
+
+        # Tag reporters outside the tiled region(s) with the capture site of
+        # their fragment in a single merge rather than re-scanning the full
+        # slices frame with an isin per capture site.
+        parent_read_to_capture = df_captures[
+            ["parent_read", "capture"]
+        ].drop_duplicates()
+        df_outside_capture = (
+            self.slices.query("capture_count == 0")[["parent_read", "chrom"]]
+            .merge(parent_read_to_capture, on="parent_read")
+        )
+
+        df_pseudo_reporters = pd.concat(
+            [
+                df_not_primary_capture[["capture", "chrom"]],
+                df_outside_capture[["capture", "chrom"]],
             ]
+        )
 
-            df_pseudo_reporters = pd.concat(
-                [df_not_primary_capture, df_outside_capture]
-            )
-            n_cis_interactions = df_pseudo_reporters.query(
-                f'chrom == "{capture_chrom}"'
-            ).shape[0]
-            n_trans_interactions = df_pseudo_reporters.shape[0] - n_cis_interactions
-
-            interactions_by_capture[capture_site] = {
-                "cis": n_cis_interactions,
-                "trans": n_trans_interactions,
-            }
+        capture_chroms = df_captures.groupby("capture")["chrom"].first()
+        is_cis = df_pseudo_reporters["chrom"].eq(
+            df_pseudo_reporters["capture"].map(capture_chroms)
+        )
 
         return (
-            pd.DataFrame(interactions_by_capture)
-            .transpose()
+            df_pseudo_reporters.assign(
+                **{"cis/trans": np.where(is_cis, "cis", "trans")}
+            )
+            .groupby(["capture", "cis/trans"])
+            .size()
+            .unstack(fill_value=0)
+            .reindex(columns=["cis", "trans"], fill_value=0)
+            .reindex(capture_chroms.index, fill_value=0)
+            .rename_axis(columns="cis/trans")
+            .stack()
+            .rename("count")
             .reset_index()
-            .rename(columns={"index": "capture"})
-            .melt(id_vars="capture", var_name="cis/trans", value_name="count")
             .sort_values("capture")
             .assign(sample=self.sample_name, read_type=self.read_type)
             .rename(columns={"capture": "viewpoint"})
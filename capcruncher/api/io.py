@@ -1,4 +1,5 @@
 import glob
+import itertools
 from loguru import logger
 import multiprocessing
 import os
@@ -37,6 +38,7 @@ class FastqReaderProcess(multiprocessing.Process):
         input_files: Union[str, list],
         outq: multiprocessing.Queue,
         read_buffer: int = 100000,
+        n_workers: int = 1,
     ) -> None:
         # Input variables
         self.input_files = input_files
@@ -51,6 +53,7 @@ class FastqReaderProcess(multiprocessing.Process):
 
         # Multiprocessing variables
         self.outq = outq
+        self.n_workers = n_workers
 
         # Reader variables
         self.read_buffer = read_buffer
@@ -66,24 +69,30 @@ class FastqReaderProcess(multiprocessing.Process):
             return False
 
     def run(self):
-        """Performs reading and chunking of fastq file(s)."""
+        """Performs reading and chunking of fastq file(s).
+
+        Batches are tagged with their part number i.e. (part_number, reads) so
+        that any number of workers can consume them without synchronisation.
+        """
 
         try:
             buffer = []
+            part_number = 0
             rc = 0
             for read_counter, read in enumerate(zip(*self._input_files_pysam)):
-                # print(f"read_counter: {read_counter}, read: {read}, read_buffer: {self.read_buffer}")
                 buffer.append(read)
                 if read_counter % self.read_buffer == 0 and not read_counter == 0:
-                    self.outq.put(buffer.copy())
+                    self.outq.put((part_number, buffer.copy()))
                     buffer.clear()
+                    part_number += 1
                     logger.info(f"{read_counter} reads parsed (batch)")
                     rc = read_counter
                 else:
                     rc = read_counter
 
-            self.outq.put(buffer)  # Deal with remainder
-            self.outq.put_nowait(None)  # Poison pill to terminate queue
+            if buffer:
+                self.outq.put((part_number, buffer))  # Deal with remainder
+
             logger.info(f"{rc} reads parsed (final)")
 
         except Exception as e:
@@ -94,60 +103,184 @@ class FastqReaderProcess(multiprocessing.Process):
             for fh in self._input_files_pysam:
                 fh.close()
 
+            for _ in range(self.n_workers):
+                self.outq.put(None)  # Poison pill to terminate each worker
+
+
+def open_fastq_writer(
+    path: os.PathLike, compression_level: int = 1, threads: int = 4
+):
+    """Opens a binary file handle for writing fastq output.
+
+    Gzipped output is routed through ISA-L's threaded igzip writer when
+    python-isal is installed (several fold faster than zlib at the same
+    ratio), falling back to xopen. Paths ending in .zst are written with
+    zstandard. Uncompressed paths are opened directly with xopen.
+
+    Args:
+     path (os.PathLike): Output file path. Compression is inferred from the extension.
+     compression_level (int, optional): Compression level for the output. Defaults to 1.
+     threads (int, optional): Number of compression threads per file. Defaults to 4.
+
+    Returns:
+     File handle opened in binary write mode.
+    """
+
+    path = str(path)
+
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstandard is required for .zst output. "
+                "Install it (pip install zstandard) or use gzip output."
+            ) from e
+
+        return zstandard.ZstdCompressor(level=compression_level).stream_writer(
+            open(path, "wb")
+        )
+
+    elif path.endswith(".gz") and compression_level <= 3:  # igzip max level is 3
+        try:
+            from isal import igzip_threaded
+
+            return igzip_threaded.open(
+                path, "wb", compresslevel=compression_level, threads=threads
+            )
+        except ImportError:
+            pass
+
+    return xopen(path, "wb", compresslevel=compression_level, threads=threads)
+
+
+def fastq_reads_to_bytes(reads) -> list:
+    """Formats a batch of read tuples into a single bytes block per read number.
+
+    Building the raw fastq bytes for an entire batch and joining them once
+    avoids paying a python call (format + encode + write) per record.
+
+    Args:
+     reads: List of read tuples [(r1, r2), ...] as produced by FastqReaderProcess.
+
+    Returns:
+     list: One bytes block per read number i.e. [r1_block, r2_block].
+    """
+
+    blocks = []
+    for read_glob in zip(*reads):
+        buffer = []
+        for read in read_glob:
+            name = read.name.encode("ascii")
+            comment = getattr(read, "comment", None)
+            if comment:
+                name = b" ".join([name, comment.encode("ascii")])
+
+            buffer.append(
+                b"@%b\n%b\n+\n%b\n"
+                % (name, read.sequence.encode("ascii"), read.quality.encode("ascii"))
+            )
+
+        blocks.append(b"".join(buffer))
+
+    return blocks
+
+
+class FastqRawReaderProcess(multiprocessing.Process):
+    """Reads fastq file(s) in chunks of raw 4-line byte blocks.
+
+    Unlike FastqReaderProcess, records are never parsed into python objects;
+    the raw bytes of each 4-line record are copied straight into a per-file
+    buffer. This is all the splitter requires as it only re-emits records,
+    so the decode/encode round-trip and per-record object construction are
+    skipped entirely.
+
+    Attributes:
+     input_files: Input fastq files.
+     outq: Output queue for (part_number, [bytes block per file]) tuples.
+     read_buffer: Number of reads accumulated per chunk.
+     n_workers: Number of consumer processes requiring a termination signal.
+    """
 
-class FastqReadFormatterProcess(multiprocessing.Process):
     def __init__(
         self,
-        inq: multiprocessing.SimpleQueue,
-        outq: multiprocessing.SimpleQueue,
-        formatting: list = None,
+        input_files: Union[str, list],
+        outq: multiprocessing.Queue,
+        read_buffer: int = 100000,
+        n_workers: int = 1,
     ) -> None:
-        self.inq = inq
-        self.outq = outq
-        self.formatting = (
-            [
-                self._format_as_str,
-            ]
-            if not formatting
-            else formatting
-        )
+        if isinstance(input_files, (str, pathlib.Path)):
+            self.input_files = [input_files]
+        else:
+            self.input_files = list(input_files)
 
-        super(FastqReadFormatterProcess, self).__init__()
+        self.outq = outq
+        self.read_buffer = read_buffer
+        self.n_workers = n_workers
 
-    def _format_as_str(self, reads):
-        # [(r1, r2), (r1, r2)] -> [r1 combined string, r2 combined string]
-        return ["\n".join([str(rn) for rn in r]) for r in zip(*reads)]
+        super(FastqRawReaderProcess, self).__init__()
 
     def run(self):
+        """Reads raw records and places chunked byte blocks on the output queue."""
+
+        handles = [xopen(fn, "rb") for fn in self.input_files]
+
         try:
-            reads = self.inq.get()
+            buffers = [bytearray() for _ in handles]
+            part_number = 0
+            read_counter = 0
 
-            while not reads == "END":
-                for formatting_to_apply in self.formatting:
-                    reads = formatting_to_apply(reads)
+            while True:
+                blocks = [b"".join(itertools.islice(fh, 4)) for fh in handles]
 
-                self.outq.put(reads)
-                reads = self.inq.get()
+                if not blocks[0]:  # End of input
+                    break
 
-            self.outq.put("END")
+                for buffer, block in zip(buffers, blocks):
+                    buffer += block
 
-        except Exception:
-            traceback.format_exc()
-            self.outq.put("END")
+                read_counter += 1
+                if read_counter % self.read_buffer == 0:
+                    self.outq.put((part_number, [bytes(buffer) for buffer in buffers]))
+                    for buffer in buffers:
+                        buffer.clear()
+                    part_number += 1
+                    logger.info(f"{read_counter} reads parsed (batch)")
+
+            if buffers[0]:
+                self.outq.put((part_number, [bytes(buffer) for buffer in buffers]))
+
+            logger.info(f"{read_counter} reads parsed (final)")
+
+        except Exception as e:
+            logger.info(f"Reader failed with exception: {e}")
+            raise
+
+        finally:
+            for fh in handles:
+                fh.close()
+
+            for _ in range(self.n_workers):
+                self.outq.put(None)  # Poison pill to terminate each worker
 
 
 class FastqWriterSplitterProcess(multiprocessing.Process):
+    """Writes part-tagged batches of reads to their own numbered output file(s).
+
+    Several instances can consume from the same queue in parallel as each part
+    is compressed and written independently i.e. there is no shared deflate
+    state between output chunks.
+    """
+
     def __init__(
         self,
         inq: multiprocessing.Queue,
         output_prefix: Union[str, list],
         paired_output: bool = False,
         gzip=False,
-        compression_level: int = 3,
-        compression_threads: int = 8,
-        n_subprocesses: int = 1,
-        n_workers_terminated: int = 0,
-        n_files_written: int = 0,
+        compression_level: int = 1,
+        compression_threads: int = 1,
+        compression_format: str = "gz",
     ):
         self.inq = inq
         self.output_prefix = output_prefix
@@ -156,29 +289,27 @@ class FastqWriterSplitterProcess(multiprocessing.Process):
         self.gzip = gzip
         self.compression_level = compression_level
         self.compression_threads = compression_threads
-
-        self.n_subprocesses = n_subprocesses
-        self.n_workers_terminated = n_workers_terminated
-        self.n_files_written = n_files_written
+        self.compression_format = compression_format
 
         super(FastqWriterSplitterProcess, self).__init__()
 
-    def _get_file_handles(self):
+    def _get_file_handles(self, part_number: int):
+        suffix = f".{self.compression_format}" if self.gzip else ""
+
         if not self.paired_output:
             fnames = [
-                f'{self.output_prefix}_part{self.n_files_written}.fastq{".gz" if self.gzip else ""}',
+                f"{self.output_prefix}_part{part_number}.fastq{suffix}",
             ]
         else:
             fnames = [
-                f'{self.output_prefix}_part{self.n_files_written}_{i+1}.fastq{".gz" if self.gzip else ""}'
+                f"{self.output_prefix}_part{part_number}_{i+1}.fastq{suffix}"
                 for i in range(2)
             ]
 
         return [
-            xopen(
+            open_fastq_writer(
                 fn,
-                "w",
-                compresslevel=self.compression_level,
+                compression_level=self.compression_level,
                 threads=self.compression_threads,
             )
             for fn in fnames
@@ -186,31 +317,22 @@ class FastqWriterSplitterProcess(multiprocessing.Process):
 
     def run(self):
         try:
-            reads = self.inq.get()
-            is_string_input = True if isinstance(reads[0], str) else False
+            while True:
+                entry = self.inq.get()
 
-            while self.n_workers_terminated < self.n_subprocesses:
-                if reads == "END":
-                    self.n_workers_terminated += 1
-                    continue
+                if entry is None:  # Poison pill
+                    break
 
-                elif is_string_input:
-                    for fh, read in zip(self._get_file_handles(), reads):
-                        fh.write(read)
-                        fh.close()
-
-                else:
-                    reads_str = [
-                        "\n".join([str(r) for r in read_glob])
-                        for read_glob in zip(*reads)
-                    ]
+                part_number, reads = entry
 
-                    for fh, read_set in zip(self._get_file_handles(), reads_str):
-                        fh.write((read_set + "\n"))
-                        fh.close()
+                if isinstance(reads[0], bytes):  # Pre-formatted raw blocks
+                    blocks = reads
+                else:  # Unformatted read tuples
+                    blocks = fastq_reads_to_bytes(reads)
 
-                reads = self.inq.get()
-                self.n_files_written += 1
+                for fh, block in zip(self._get_file_handles(part_number), blocks):
+                    fh.write(block)
+                    fh.close()
 
         except Exception:
             traceback.format_exc()
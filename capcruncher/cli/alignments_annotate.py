@@ -3,7 +3,7 @@ import sys
 import warnings
 from typing import Tuple
 
-import pandas as pd
+import polars as pl
 import pyranges as pr
 from loguru import logger
 from pybedtools import BedTool
@@ -70,14 +70,25 @@ def annotate(
 
         if slices == "-":
             logger.info("Reading slices from stdin")
-            slices = pd.read_csv(sys.stdin, sep="\t", header=None).pipe(pr.PyRanges)
+            # polars parses the stream with multiple threads unlike the
+            # single-threaded pandas csv reader
+            slices = (
+                pl.read_csv(
+                    sys.stdin.buffer,
+                    separator="\t",
+                    has_header=False,
+                    new_columns=["Chromosome", "Start", "End", "Name"],
+                )
+                .to_pandas()
+                .pipe(pr.PyRanges)
+            )
 
         elif slices.endswith(".bam"):
             logger.info("Converting bam to bed")
             slices = BedTool(slices).bam_to_bed().to_dataframe().pipe(convert_bed_to_pr)
 
         else:
-            slices = pr.PyRanges(slices)
+            slices = convert_bed_to_pr(slices)
 
         logger.info("Validating input bed file before annotation")
 
@@ -34,8 +34,13 @@ def merge_annotations(slices: os.PathLike, annotations: os.PathLike) -> pd.DataF
 
     with pl.StringCache():
         df_slices = pl.scan_parquet(slices)
-        df_annotations = pl.scan_parquet(annotations).rename(
-            {"Chromosome": "chrom", "Start": "start", "End": "end"}
+        # The annotation interval end duplicates the slice end and is not a
+        # join key so drop it before the join rather than materialising an
+        # end_right column for every slice.
+        df_annotations = (
+            pl.scan_parquet(annotations)
+            .rename({"Chromosome": "chrom", "Start": "start"})
+            .drop("End")
         )
 
         df_slices = df_slices.join(
@@ -147,15 +152,16 @@ def filter(
             f.write(stats_list.model_dump_json())
 
         # Write output
-        df_slices = slice_filter.slices
         df_slices_with_viewpoint = slice_filter.slices_with_viewpoint
         df_capture = slice_filter.captures
 
         if fragments:
             logger.info("Writing reporters at the fragment level")
+            # fragments is a property over the filtered slices, so reuse the
+            # existing filter rather than re-running the constructor (schema
+            # validation + sort) on an identical frame.
             df_fragments = (
-                slice_filter_class(df_slices)
-                .fragments.join(
+                slice_filter.fragments.join(
                     df_capture["capture"], lsuffix="_slices", rsuffix="_capture"
                 )
                 .rename(
@@ -168,7 +174,8 @@ def filter(
 
             df_fragments.to_parquet(
                 f"{output_prefix}.fragments.parquet",
-                compression="snappy",
+                compression="zstd",
+                compression_level=3,
                 engine="pyarrow",
             )
 
@@ -185,9 +192,12 @@ def filter(
             to_convert
         ].astype("category")
 
+        # zstd at level 3 compresses markedly better than snappy at similar
+        # write speed; categorical columns are already dictionary encoded.
         df_slices_with_viewpoint.to_parquet(
             f"{output_prefix}.slices.parquet",
-            compression="snappy",
+            compression="zstd",
+            compression_level=3,
             engine="pyarrow",
         )
 
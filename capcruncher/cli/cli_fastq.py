@@ -70,7 +70,19 @@ def cli():
 @click.option(
     "--compression_level",
     help="Level of compression for output files",
-    default=5,
+    default=1,
+    type=click.INT,
+)
+@click.option(
+    "--compression_format",
+    help="Compression format for output files (python method only)",
+    type=click.Choice(["gz", "zst"]),
+    default="gz",
+)
+@click.option(
+    "--compression_threads",
+    help="Number of compression threads per output file (python method only)",
+    default=1,
     type=click.INT,
 )
 @click.option(
@@ -84,6 +96,13 @@ def cli():
     "--gzip/--no-gzip", help="Determines if files are gziped or not", default=False
 )
 @click.option("-p", "--n_cores", default=1, type=click.INT)
+@click.option(
+    "-w",
+    "--n_workers",
+    help="Number of worker processes writing output chunks in parallel (python method only)",
+    default=4,
+    type=click.INT,
+)
 @click.option(
     "-s",
     "--suffix",
@@ -91,6 +91,13 @@ def deduplicate(*args, **kwargs):
     type=click.Choice(["bedgraph", "bigwig"], case_sensitive=False),
     default="bedgraph",
 )
+@click.option(
+    "-p",
+    "--n-cores",
+    help="Number of viewpoints to extract and write in parallel.",
+    default=1,
+    type=int,
+)
 def pileup(*args, **kwargs):
     """
     Extracts reporters from a capture experiment and generates a bedgraph file.
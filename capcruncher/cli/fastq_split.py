@@ -9,7 +9,7 @@ Script splits a fastq into specified chunks
 """
 
 from loguru import logger
-from multiprocessing import SimpleQueue
+from multiprocessing import Queue
 from typing import Tuple
 import subprocess
 import glob
@@ -65,12 +65,15 @@ def split(
     method: Literal["python", "unix", "seqkit"] = "unix",
     split_type: Literal["n-reads", "n-parts"] = "n-reads",
     output_prefix: os.PathLike = "split",
-    compression_level: int = 5,
+    compression_level: int = 1,
+    compression_format: Literal["gz", "zst"] = "gz",
+    compression_threads: int = 1,
     n_reads: int = 1000000,
     n_parts: int = 1,
     suffix: str = "",
     gzip: bool = True,
     n_cores: int = 1,
+    n_workers: int = 4,
 ):
     """
     Splits fastq file(s) into equal chunks of n reads.
@@ -82,45 +85,57 @@ def split(
      input_files (Tuple): Input fastq files to process.
      method (str, optional): Python or unix method (faster but not guarenteed to mantain read pairings) to split the fastq files. Defaults to "unix".
      output_prefix (os.PathLike, optional): Output prefix for split fastq files. Defaults to "split".
-     compression_level (int, optional): Compression level for gzipped output. Defaults to 5.
+     compression_level (int, optional): Compression level for compressed output. Defaults to 1.
+     compression_format (str, optional): Compression format for output chunks, gzip (gz) or zstandard (zst) (python method only). Defaults to "gz".
+     compression_threads (int, optional): Compression threads per output file (python method only). Defaults to 1 as parallelism comes from n_workers.
      n_reads (int, optional): Number of reads to split the input fastq files into. Defaults to 1000000.
      gzip (bool, optional): Gzip compress output files if True. Defaults to True.
+     n_workers (int, optional): Number of writer processes compressing output chunks in parallel (python method only). Defaults to 4.
 
     """
 
     from capcruncher.api.io import (
-        FastqReaderProcess,
+        FastqRawReaderProcess,
         FastqWriterSplitterProcess,
-        FastqReadFormatterProcess,
     )
 
     if split_type == "n-reads" and method == "python":
-        readq = SimpleQueue()
-        writeq = SimpleQueue()
+        # One reader fills a bounded queue of part-tagged raw byte blocks and
+        # n_workers writer processes compress separate chunks in parallel.
+        readq = Queue(maxsize=n_workers)
 
         paired = True if len(input_files) > 1 else False
 
-        reader = FastqReaderProcess(
+        # One compression thread per output file by default; with a writer
+        # process per in-flight chunk, extra threads per file just
+        # oversubscribe the CPU and starve the reader.
+        logger.info(
+            f"Allocating 1 reader, {n_workers} writer(s) x "
+            f"{compression_threads} compression thread(s) "
+            f"({n_workers * compression_threads * (2 if paired else 1)} compression threads total)"
+        )
+
+        reader = FastqRawReaderProcess(
             input_files=input_files,
             outq=readq,
             read_buffer=n_reads,
-            n_subprocesses=1,
+            n_workers=n_workers,
         )
 
-        formatter = [
-            FastqReadFormatterProcess(inq=readq, outq=writeq) for _ in range(1)
+        writers = [
+            FastqWriterSplitterProcess(
+                inq=readq,
+                output_prefix=output_prefix,
+                paired_output=paired,
+                gzip=gzip,
+                compression_level=compression_level,
+                compression_threads=compression_threads,
+                compression_format=compression_format,
+            )
+            for _ in range(n_workers)
         ]
 
-        writer = FastqWriterSplitterProcess(
-            inq=writeq,
-            output_prefix=output_prefix,
-            paired_output=paired,
-            n_subprocesses=1,
-            gzip=gzip,
-            compression_level=compression_level,
-        )
-
-        processes = [writer, reader, *formatter]
+        processes = [*writers, reader]
 
         for proc in processes:
             proc.start()
@@ -8,7 +8,74 @@ import tempfile
 from typing import Literal
 
 import cooler
+from joblib import Parallel, delayed
+
 from capcruncher.api.pileup import CoolerBedGraph
+from capcruncher.utils import save_dataframe_to_tsv
+
+
+def _pileup_viewpoint(
+    uri: os.PathLike,
+    viewpoint_name: str,
+    output_prefix: os.PathLike,
+    format: str,
+    normalisation: str,
+    normalisation_regions: os.PathLike,
+    binsize: int,
+    gzip: bool,
+    scale_factor: int,
+    sparse: bool,
+):
+    """Extracts and writes the pileup for a single viewpoint.
+
+    Kept as a module level function so viewpoints can be processed in
+    parallel worker processes; each worker owns its own output file(s).
+    """
+
+    cooler_group = f"{uri}::{viewpoint_name}"
+
+    if binsize > 0:
+        cooler_group = f"{cooler_group}/resolutions/{binsize}"
+
+    try:
+        cooler.fileops.is_cooler(cooler_group)
+    except Exception as e:
+        logger.info(f"Exception {e} occured while looking for: {viewpoint_name}")
+        raise (f"Cannot find {viewpoint_name} in cooler file")
+
+    bedgraph = CoolerBedGraph(uri=cooler_group, sparse=sparse).extract_bedgraph(
+        normalisation=normalisation,
+        region=normalisation_regions,
+        scale_factor=scale_factor,
+    )
+
+    logger.info(f"Generated bedgraph for {viewpoint_name}")
+
+    if format == "bedgraph":
+
+        save_dataframe_to_tsv(
+            bedgraph,
+            f'{output_prefix}_{viewpoint_name}.bedgraph{".gz" if gzip else ""}',
+            include_header=False,
+        )
+
+    elif format == "bigwig":
+
+        clr = cooler.Cooler(cooler_group)
+
+        with tempfile.NamedTemporaryFile() as chromsizes_tmp:
+            with tempfile.NamedTemporaryFile() as bedgraph_tmp:
+                clr.chromsizes.to_csv(chromsizes_tmp, sep="\t", header=False)
+                bedgraph.to_csv(bedgraph_tmp, sep="\t", index=False, header=False)
+
+                _result = subprocess.run(
+                    [
+                        "bedGraphToBigWig",
+                        bedgraph_tmp.name,
+                        chromsizes_tmp.name,
+                        f"{output_prefix}_{viewpoint_name}.bigWig",
+                    ]
+                )
 
 
 def pileup(
@@ -22,6 +89,7 @@ def pileup(
     gzip: bool = True,
     scale_factor: int = 1e6,
     sparse: bool = True,
+    n_cores: int = 1,
 ):
     """
     Extracts reporters from a capture experiment and generates a bedgraph file.
@@ -44,6 +112,7 @@ def pileup(
      gzip (bool, optional): Compress output bedgraph with gzip. Defaults to True.
      scale_factor (int, optional): Scaling factor for normalisation. Defaults to 1e6.
      sparse (bool, optional): Produce bedgraph containing just positive bins (True) or all bins (False). Defaults to True.
+     n_cores (int, optional): Number of viewpoints to extract and write in parallel. Defaults to 1.
     """
 
     viewpoint_names = viewpoint_names or [
@@ -52,52 +121,22 @@ def pileup(
 
     logger.info(f"Performing pileup for {viewpoint_names}")
 
-    bin_bedgraph = True if binsize > 0 else False
-
-    for ii, viewpoint_name in enumerate(viewpoint_names):
-
-        cooler_group = f"{uri}::{viewpoint_name}"
-
-        if bin_bedgraph:
-            cooler_group = f"{cooler_group}/resolutions/{binsize}"
-
-        try:
-            cooler.fileops.is_cooler(cooler_group)
-        except Exception as e:
-            logger.info(f"Exception {e} occured while looking for: {viewpoint_name}")
-            raise (f"Cannot find {viewpoint_name} in cooler file")
-
-        bedgraph = CoolerBedGraph(uri=cooler_group, sparse=sparse).extract_bedgraph(
+    # Each viewpoint is extracted and written independently so the
+    # formatting/compression cost is spread over a process pool.
+    tasks = [
+        delayed(_pileup_viewpoint)(
+            uri,
+            viewpoint_name,
+            output_prefix=output_prefix,
+            format=format,
             normalisation=normalisation,
-            region=normalisation_regions,
+            normalisation_regions=normalisation_regions,
+            binsize=binsize,
+            gzip=gzip,
             scale_factor=scale_factor,
+            sparse=sparse,
         )
+        for viewpoint_name in viewpoint_names
+    ]
 
-        logger.info(f"Generated bedgraph for {viewpoint_name}")
-
-        if format == "bedgraph":
-
-            bedgraph.to_csv(
-                f'{output_prefix}_{viewpoint_name}.bedgraph{".gz" if gzip else ""}',
-                sep="\t",
-                header=False,
-                index=False,
-            )
-
-        elif format == "bigwig":
-
-            clr = cooler.Cooler(cooler_group)
-
-            with tempfile.NamedTemporaryFile() as chromsizes_tmp:
-                with tempfile.NamedTemporaryFile() as bedgraph_tmp:
-                    clr.chromsizes.to_csv(chromsizes_tmp, sep="\t", header=False)
-                    bedgraph.to_csv(bedgraph_tmp, sep="\t", index=False, header=False)
-
-                    _result = subprocess.run(
-                        [
-                            "bedGraphToBigWig",
-                            bedgraph_tmp.name,
-                            chromsizes_tmp.name,
-                            f"{output_prefix}_{viewpoint_name}.bigWig",
-                        ]
-                    )
+    Parallel(n_jobs=n_cores, backend="loky")(tasks)
@@ -236,6 +236,51 @@ def save_dict(obj: Union[dict, set], fn: os.PathLike, format: str) -> dict:
     return fn
 
 
+def save_dataframe_to_tsv(
+    df: pd.DataFrame, fn: os.PathLike, include_header: bool = True
+) -> os.PathLike:
+    """Writes a dataframe as a (optionally gzipped) tsv file.
+
+    Values are formatted with pyarrow's multithreaded csv writer rather than
+    pandas to_csv, and gzipped output is compressed with ISA-L's accelerated
+    igzip when python-isal is installed (falling back to xopen).
+
+    Note that pyarrow renders integral floats without a trailing ".0"
+    (e.g. 7 rather than pandas' 7.0), so output files may differ textually
+    from to_csv for identical values.
+    """
+
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    fn = str(fn)
+
+    if fn.endswith(".gz"):
+        try:
+            from isal import igzip
+
+            sink = igzip.open(fn, "wb", compresslevel=1)
+        except ImportError:
+            from xopen import xopen
+
+            sink = xopen(fn, "wb", compresslevel=1)
+    else:
+        sink = open(fn, "wb")
+
+    try:
+        pacsv.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False),
+            sink,
+            pacsv.WriteOptions(
+                include_header=include_header, delimiter="\t", quoting_style="none"
+            ),
+        )
+    finally:
+        sink.close()
+
+    return fn
+
+
 def get_timing(task_name=None) -> Callable:
     """Decorator:
     Gets the time taken by the wrapped function
@@ -544,6 +589,8 @@ def get_file_type(fn: os.PathLike) -> str:
         "json": "json",
         "tsv": "tsv",
         "h5": "hdf5",
+        "npy": "numpy",
+        "bin": "binary",
         "pkl": "pickle",
         "pickle": "pickle",
         "parquet": "parquet",
@@ -0,0 +1,114 @@
+import multiprocessing
+from collections import namedtuple
+
+import numpy as np
+import pytest
+
+from capcruncher.api.deduplicate import (
+    ReadDeduplicationParserProcess,
+    ReadDuplicateRemovalProcess,
+    find_duplicates,
+    identify_duplicates,
+    read_duplicated_ids,
+)
+
+Read = namedtuple("Read", ["name", "sequence", "quality"])
+
+
+@pytest.fixture()
+def read_pairs():
+    # Six read pairs; pairs 3 and 5 duplicate the sequences of pairs 0 and 1
+    sequence_pairs = [
+        ("ATCGATCG", "GGCCTTAA"),
+        ("TTTTAAAA", "CCCCGGGG"),
+        ("ACGTACGT", "TGCATGCA"),
+        ("ATCGATCG", "GGCCTTAA"),
+        ("AATTCCGG", "GGAATTCC"),
+        ("TTTTAAAA", "CCCCGGGG"),
+    ]
+
+    return [
+        (
+            Read(f"read{ii}/1", s1, "I" * len(s1)),
+            Read(f"read{ii}/2", s2, "I" * len(s2)),
+        )
+        for ii, (s1, s2) in enumerate(sequence_pairs)
+    ]
+
+
+def parse_read_pairs(read_pairs, output_path):
+    inq = multiprocessing.Queue()
+    inq.put(read_pairs)
+    inq.put(None)
+
+    parser = ReadDeduplicationParserProcess(inq=inq, output_path=str(output_path))
+    parser.run()
+
+
+@pytest.mark.parametrize("parsed_format", ["npy", "json"])
+def test_deduplication_round_trip(read_pairs, parsed_format, tmp_path):
+    parsed = tmp_path / f"parsed.{parsed_format}"
+    duplicates = tmp_path / "duplicates.bin"
+
+    parse_read_pairs(read_pairs, parsed)
+
+    n_duplicates = identify_duplicates([str(parsed)], output=str(duplicates))
+    assert n_duplicates == 2
+
+    ids_duplicated = read_duplicated_ids(str(duplicates))
+    assert ids_duplicated.dtype == np.uint64
+    assert ids_duplicated.size == 2
+    assert np.all(ids_duplicated[:-1] <= ids_duplicated[1:])  # Sorted contract
+
+    inq = multiprocessing.Queue()
+    outq = multiprocessing.Queue()
+    stats_rx, stats_tx = multiprocessing.Pipe(duplex=False)
+
+    inq.put(read_pairs)
+    inq.put(None)
+
+    removal = ReadDuplicateRemovalProcess(
+        inq=inq,
+        outq=outq,
+        stats_tx=stats_tx,
+        duplicated_ids=ids_duplicated,
+        hash_read_name=False,
+    )
+    removal.run()
+
+    reads_unique = outq.get()
+    stats = stats_rx.recv()
+
+    assert stats.reads_total == 6
+    assert stats.reads_unique == 4
+    assert stats.reads_removed == 2
+    assert [r1.name for (r1, r2) in reads_unique] == [
+        "read0/1",
+        "read1/1",
+        "read2/1",
+        "read4/1",
+    ]
+
+
+def test_duplicated_ids_json_round_trip(read_pairs, tmp_path):
+    parsed = tmp_path / "parsed.npy"
+    duplicates_bin = tmp_path / "duplicates.bin"
+    duplicates_json = tmp_path / "duplicates.json"
+
+    parse_read_pairs(read_pairs, parsed)
+
+    identify_duplicates([str(parsed)], output=str(duplicates_bin))
+    identify_duplicates([str(parsed)], output=str(duplicates_json))
+
+    ids_from_bin = read_duplicated_ids(str(duplicates_bin))
+    ids_from_json = read_duplicated_ids(str(duplicates_json))
+
+    assert np.array_equal(ids_from_bin, ids_from_json)
+
+
+def test_identify_duplicates_empty_input(tmp_path):
+    duplicates = tmp_path / "duplicates.bin"
+
+    assert list(find_duplicates([])) == []
+    assert identify_duplicates([], output=str(duplicates)) == 0
+    assert read_duplicated_ids(str(duplicates)).size == 0